@@ -9,6 +9,13 @@ from routes.deps import get_db, require_admin
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+
+def _iso_utc(value):
+    """last_scan_at as an offset-aware isoformat string (BSON dates read back naive UTC)"""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=timezone.utc).isoformat()
+    return value
+
 class CreateUserRequest(BaseModel):
     email: str
     name: str
@@ -67,6 +74,8 @@ async def get_admin_users(skip: int = 0, limit: int = 50, admin: User = Depends(
     
     # Add payment status placeholder (would integrate with Stripe)
     for user in users:
+        if "last_scan_at" in user:
+            user["last_scan_at"] = _iso_utc(user["last_scan_at"])
         user["has_openai_key"] = bool(await db.users.find_one({"id": user["id"], "openai_api_key": {"$ne": None}}))
         user["has_telegram"] = bool(await db.users.find_one({"id": user["id"], "telegram_bot_token": {"$ne": None}}))
     
@@ -93,7 +102,7 @@ async def get_admin_user_detail(user_id: str, admin: User = Depends(require_admi
     user["has_telegram"] = bool(full_user.get("telegram_bot_token"))
     user["telegram_chat_id"] = full_user.get("telegram_chat_id")
     user["free_report_sent"] = full_user.get("free_report_sent", False)
-    user["last_scan_at"] = full_user.get("last_scan_at")
+    user["last_scan_at"] = _iso_utc(full_user.get("last_scan_at"))
     user["scan_count"] = scan_count
     user["launch_kit_count"] = launch_kit_count
     
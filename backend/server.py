@@ -5,6 +5,7 @@ from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
 import os
 import logging
 from pathlib import Path
@@ -50,11 +51,19 @@ async def startup_event():
     try:
         await db.users.create_index("email", unique=True)
         await db.users.create_index("id", unique=True)
+        # Scheduler due-for-scan check: an $or only avoids a collection scan when every clause
+        # is indexed - per-tier last_scan_at ranges use the compound index, the never-scanned
+        # (null) and legacy-string clauses use the single-field one
+        await db.users.create_index([("subscription_tier", 1), ("last_scan_at", 1)])
+        await db.users.create_index("last_scan_at")
         await db.products.create_index("id", unique=True)
         await db.products.create_index([("overall_score", -1)])
         await db.daily_products.create_index([("scan_date", 1), ("is_active", 1)])
         await db.daily_products.create_index([("user_id", 1), ("scan_date", -1)])
         await db.daily_products.create_index([("user_id", 1), ("discovered_at", -1)])
+        # Daily report lookups: today's active products by score, then any active products by score
+        await db.daily_products.create_index([("user_id", 1), ("scan_date", 1), ("is_active", 1), ("overall_score", -1)])
+        await db.daily_products.create_index([("user_id", 1), ("is_active", 1), ("overall_score", -1)])
         await db.launch_kits.create_index("user_id")
         await db.launch_kits.create_index("id", unique=True)
         await db.competitors.create_index("user_id")
@@ -64,6 +73,25 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to create indexes: {e}")
 
+    # last_scan_at used to be written as an isoformat string - convert leftovers to BSON
+    # dates so the scheduler's due-for-scan range filter matches them. Parsed in Python
+    # (Mongo's $toDate rejects microsecond isoformat); unparseable values become "never scanned".
+    try:
+        updates = []
+        async for doc in db.users.find({"last_scan_at": {"$type": "string"}}, {"_id": 1, "last_scan_at": 1}):
+            try:
+                last_scan = datetime.fromisoformat(doc["last_scan_at"].replace("Z", "+00:00"))
+                if last_scan.tzinfo is None:
+                    last_scan = last_scan.replace(tzinfo=timezone.utc)
+            except ValueError:
+                last_scan = None
+            updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"last_scan_at": last_scan}}))
+        if updates:
+            result = await db.users.bulk_write(updates, ordered=False)
+            logger.info(f"Converted last_scan_at to dates for {result.modified_count} users")
+    except Exception as e:
+        logger.error(f"Failed to migrate last_scan_at: {e}")
+
     # Start background scheduler
     from services.scheduler import start_scheduler
     try:
@@ -72,6 +100,14 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to start scheduler: {e}")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Release pooled scraper and Telegram connections
+    from services.scanners import close_shared_client as close_scanner_client
+    from services.telegram_bot import close_shared_client as close_telegram_client
+    await close_scanner_client()
+    await close_telegram_client()
+
 # CORS - Use FRONTEND_URL for production, fallback to permissive for dev
 FRONTEND_URL = os.environ.get('FRONTEND_URL', '')
 CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '')
@@ -14,6 +14,8 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+_RE_IMG_URL = re.compile(r'"imgUrl"\s*:\s*"(https?://[^"]+\.(?:jpg|png|webp)[^"]*)"')
+
 # Headers for image fetching
 _IMAGE_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
@@ -31,12 +33,12 @@ async def _fetch_product_image(product_name: str) -> str:
             if resp.status_code == 200:
                 text = resp.text
                 # Extract image URLs from script data
-                img_matches = re.findall(r'"imgUrl"\s*:\s*"(https?://[^"]+\.(?:jpg|png|webp)[^"]*)"', text)
+                img_matches = _RE_IMG_URL.findall(text)
                 if img_matches:
                     return img_matches[0]
                 # Fallback: extract from img tags
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(text, "html.parser")
+                from bs4 import BeautifulSoup, SoupStrainer
+                soup = BeautifulSoup(text, "lxml", parse_only=SoupStrainer("img"))
                 for img in soup.select("img[src*='alicdn.com'], img[src*='ae01.alicdn']"):
                     src = img.get("src", "")
                     if src and ("jpg" in src or "png" in src or "webp" in src):
@@ -312,19 +314,18 @@ Return as JSON: {{"products": [...]}}"""
         # Get real competition data from Meta Ad Library and supplier data
         from services.scanners import MetaAdLibraryScanner, AliExpressScanner
 
-        ad_data = {}
-        suppliers = []
-        try:
-            meta = MetaAdLibraryScanner()
-            ad_data = await meta.scan_product_ads(product_name)
-        except Exception as e:
-            logger.warning(f"Meta Ad scrape failed for analysis: {e}")
-
-        try:
-            ali = AliExpressScanner()
-            suppliers = await ali.find_suppliers(product_name)
-        except Exception as e:
-            logger.warning(f"AliExpress supplier search failed for analysis: {e}")
+        # Both lookups are independent network calls - run them concurrently
+        ad_data, suppliers = await asyncio.gather(
+            MetaAdLibraryScanner().scan_product_ads(product_name),
+            AliExpressScanner().find_suppliers(product_name),
+            return_exceptions=True,
+        )
+        if isinstance(ad_data, Exception):
+            logger.warning(f"Meta Ad scrape failed for analysis: {ad_data}")
+            ad_data = {}
+        if isinstance(suppliers, Exception):
+            logger.warning(f"AliExpress supplier search failed for analysis: {suppliers}")
+            suppliers = []
 
         # Build context for AI analysis
         context = f"Real competition data: {json.dumps(ad_data, default=str)}\n"
@@ -9,6 +9,9 @@ from pydantic import BaseModel, Field
 import uuid
 
 import httpx
+import orjson
+
+from services.scanners import stream_shopify_products
 
 logger = logging.getLogger(__name__)
 
@@ -81,15 +84,14 @@ async def scrape_shopify_store(store_url: str) -> Dict[str, Any]:
         while page <= 10:  # Max 10 pages (300 products)
             try:
                 url = f"{store_url}/products.json?page={page}&limit=250"
-                resp = await client.get(url, headers=headers)
+                # Pages can run to several MB - parse items incrementally as they stream in
+                status, products = await stream_shopify_products(client, url, headers, 250)
 
-                if resp.status_code != 200:
+                if status != 200:
                     if page == 1:
-                        logger.warning(f"Cannot access {store_url}/products.json - status {resp.status_code}")
+                        logger.warning(f"Cannot access {store_url}/products.json - status {status}")
                     break
 
-                data = resp.json()
-                products = data.get("products", [])
                 if not products:
                     break
 
@@ -107,7 +109,7 @@ async def scrape_shopify_store(store_url: str) -> Dict[str, Any]:
         try:
             meta_resp = await client.get(f"{store_url}/meta.json", headers=headers)
             if meta_resp.status_code == 200:
-                meta = meta_resp.json()
+                meta = orjson.loads(meta_resp.content)
                 result["store_name"] = meta.get("name", result["store_name"])
         except Exception:
             pass
@@ -116,9 +118,8 @@ async def scrape_shopify_store(store_url: str) -> Dict[str, Any]:
     categories = {}
     total_price = 0
     for p in all_products:
-        variants = p.get("variants", [{}])
-        prices = [float(v.get("price", "0")) for v in variants if v.get("price")]
-        price = min(prices) if prices else 0
+        # Lowest variant price in one pass, without building a list of all prices
+        price = min((float(v["price"]) for v in p.get("variants", ()) if v.get("price")), default=0)
         category = p.get("product_type", "Uncategorized") or "Uncategorized"
 
         categories[category] = categories.get(category, 0) + 1
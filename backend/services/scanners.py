@@ -1,18 +1,28 @@
 """
 Product Scout Services - Real Web Scrapers
 Scrapes Amazon, AliExpress, TikTok Creative Center, Meta Ad Library, and Google Trends
-using httpx + BeautifulSoup for lightweight HTTP-based scraping.
+using httpx + lxml for lightweight HTTP-based scraping.
 """
 import asyncio
 import logging
 import re
 import json
+import time
+from collections import Counter
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
-from urllib.parse import quote_plus, urlencode
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from importlib.util import find_spec
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
+from urllib.parse import quote_plus, urlencode, urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
+import ijson
+from async_lru import alru_cache
+import lxml.html
+import orjson
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +35,308 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
 ]
 
-def _get_headers(idx: int = 0) -> Dict[str, str]:
+def _supported_encodings() -> str:
+    """Accept-Encoding value limited to codecs httpx can actually decode here.
+
+    httpx only decodes br/zstd when brotli (or brotlicffi) / zstandard are importable -
+    advertising them without the codec would leave responses undecodable.
+    """
+    encodings = ["gzip", "deflate"]
+    if find_spec("brotli") or find_spec("brotlicffi"):
+        encodings.append("br")
+    else:
+        logger.warning("brotli not installed - scrapers will fall back to gzip responses")
+    if find_spec("zstandard"):
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+_ACCEPT_ENCODING = _supported_encodings()
+
+
+@lru_cache(maxsize=16)
+def _get_headers(idx: int = 0) -> Mapping[str, str]:
+    """Request headers for user agent `idx` - cached and read-only, so copy before extending"""
     ua = USER_AGENTS[idx % len(USER_AGENTS)]
-    return {
+    return MappingProxyType({
         "User-Agent": ua,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
+        "Accept-Encoding": _ACCEPT_ENCODING,
         "Connection": "keep-alive",
-    }
+    })
+
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Process-wide pooled HTTP/2 client, so TLS sessions and connections survive across scans"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            timeout=20,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the shared scanner HTTP client (called on app shutdown)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+# Fanned-out requests are capped per host instead of being spaced out with sleeps
+_HOST_CONCURRENCY = 4
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def _host_slot(url: str) -> asyncio.Semaphore:
+    """Semaphore limiting concurrent requests to the host of `url`"""
+    host = urlsplit(url).hostname or ""
+    sem = _host_semaphores.get(host)
+    if sem is None:
+        sem = _host_semaphores[host] = asyncio.Semaphore(_HOST_CONCURRENCY)
+    return sem
+
+
+# Hosts that answered 429/503 are held off until the time they asked for (Retry-After),
+# or an exponential backoff when they don't say. Cooperative hosts are never delayed.
+_RETRY_STATUSES = (429, 503)
+_MAX_RETRIES = 3
+_MAX_BACKOFF = 30.0
+_host_next_ok: Dict[str, float] = {}
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdecimal():
+        return float(value)
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _defer_host(host: str, delay: float):
+    """Hold off new requests to `host` for `delay` seconds"""
+    until = time.monotonic() + min(delay, _MAX_BACKOFF)
+    if until > _host_next_ok.get(host, 0.0):
+        _host_next_ok[host] = until
+
+
+async def _wait_for_host(host: str):
+    """Sleep only if `host` previously asked us to back off"""
+    delay = _host_next_ok.get(host, 0.0) - time.monotonic()
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+# Tag pages, category pages and supplier searches change slowly - repeat scans within
+# this window reuse the parsed results instead of re-fetching. Failures raise and are not cached -
+# that includes 200 responses that parse to nothing (bot challenges, consent pages).
+_SCRAPE_CACHE_TTL = 600
+
+
+class EmptyScrape(Exception):
+    """A fetched page yielded no results - raised so the scrape caches don't keep it"""
+
+
+def _copy_products(products) -> List[Dict[str, Any]]:
+    """Fresh product dicts from a cached result, so callers can't mutate the cache"""
+    return [{**p, "trend_data": dict(p["trend_data"])} for p in products]
+
+
+def _xp_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector `.name`"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _xp_text(nodes: list) -> str:
+    """Text of the first matched node, stripped like BeautifulSoup's get_text(strip=True)"""
+    if not nodes:
+        return ""
+    return "".join(s.strip() for s in nodes[0].itertext())
+
+
+# Byte-level patterns for the JSON blobs AliExpress embeds in <script> tags.
+# Scanning resp.content directly skips decoding the page and building a DOM.
+_ALI_SCRIPT_MARKERS = (b"window._dida_config_", b"runParams")
+_ALI_CARD_MARKERS = (b"multi--container--1UZxxHY", b"search-card-item")
+_RE_SCRIPT_B = re.compile(rb'<script[^>]*>(.*?)</script>', re.S | re.I)
+_RE_TITLE_B = re.compile(rb'"title":"([^"]{5,80})"')
+_RE_MIN_PRICE_B = re.compile(rb'"minPrice":"?(\d+\.?\d*)"?')
+_RE_TRADE_COUNT_B = re.compile(rb'"tradeCount":"?(\d+)"?')
+_RE_STAR_RATING_B = re.compile(rb'"starRating":"?(\d+\.?\d*)"?')
+_RE_IMG_URL_B = re.compile(rb'"imgUrl":"(https?://[^"]+)"')
+_RE_STORE_NAME_B = re.compile(rb'"storeName":"([^"]+)"')
+
+# Broader keyword matching for product-related hashtags
+_TIKTOK_PRODUCT_KW = (
+    "buy", "find", "product", "gadget", "must", "hack", "deal",
+    "clean", "home", "kitchen", "beauty", "fitness", "tech", "gift",
+    "amazon", "shop", "unbox", "review", "haul", "worth", "best",
+    "tool", "organiz", "storage", "lamp", "light", "phone", "car",
+)
+_RE_TIKTOK_PRODUCT_KW = re.compile("|".join(map(re.escape, _TIKTOK_PRODUCT_KW)), re.I)
+_TIKTOK_SCRIPT_MARKERS = (b"application/ld+json", b"__UNIVERSAL_DATA_FOR_REHYDRATION__", b"SIGI_STATE")
+_RE_TIKTOK_DESC = re.compile(r'"desc"\s*:\s*"([^"]{10,80})"')
+_RE_NAME_FINGERPRINT = re.compile(r'[^a-z0-9]+')
+_RE_AD_COUNT = re.compile(r'(\d[\d,]*)\s*(?:results|ads)', re.I)
+
+
+def _iter_script_blobs(body: bytes, markers: tuple):
+    """Yield the raw body of each <script> tag that contains one of the markers"""
+    # One C-level substring scan of the page decides whether any script is worth visiting
+    if not any(marker in body for marker in markers):
+        return
+    for match in _RE_SCRIPT_B.finditer(body):
+        blob = match.group(1)
+        if any(marker in blob for marker in markers):
+            yield blob
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", "replace")
+
+
+def _convert_matches(matches: list, n: int, cast, default) -> list:
+    """Convert the first n regex matches in one map() pass, padded to n with default"""
+    values = list(map(cast, matches[:n]))
+    values.extend([default] * (n - len(values)))
+    return values
+
+
+_RE_ALI_ITEM_LIST_B = re.compile(rb'"itemList"\s*:\s*\{\s*"content"\s*:\s*\[')
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _nested(obj: Any, *path: str) -> Any:
+    """Follow a chain of dict keys, returning None as soon as one is missing"""
+    for key in path:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_ali_item_list(blob: bytes) -> List[Dict[str, Any]]:
+    """Decode the itemList.content array embedded in an AliExpress script in one JSON parse"""
+    match = _RE_ALI_ITEM_LIST_B.search(blob)
+    if not match:
+        return []
+    try:
+        # raw_decode stops at the end of the array, so the surrounding
+        # (not always valid JSON) config object never has to parse
+        content, _ = _JSON_DECODER.raw_decode(_decode(blob[match.end() - 1:]))
+    except ValueError:
+        return []
+
+    items = []
+    for entry in content:
+        if not isinstance(entry, dict):
+            continue
+        title = entry.get("title")
+        if isinstance(title, dict):
+            title = title.get("displayTitle")
+        image_url = _nested(entry, "image", "imgUrl")
+        if isinstance(image_url, str) and image_url.startswith("//"):
+            image_url = "https:" + image_url
+        trade_desc = _nested(entry, "trade", "tradeDesc")
+        items.append({
+            "title": title[:80] if isinstance(title, str) else None,
+            "price": _to_float(_nested(entry, "prices", "salePrice", "minPrice")),
+            "orders": _parse_order_count(trade_desc) if isinstance(trade_desc, str) else None,
+            "rating": _to_float(_nested(entry, "evaluation", "starRating")),
+            "image_url": image_url,
+            "store_name": _nested(entry, "store", "storeName"),
+        })
+    return items
+
+
+def _extract_ali_items(blob: bytes, limit: int) -> List[Dict[str, Any]]:
+    """Listings from an AliExpress runParams/_dida_config_ script blob.
+
+    Parses the embedded item list once; when the page doesn't expose it in
+    that shape, falls back to pairing up per-field regex matches by position.
+    Missing fields are None so callers can apply their own defaults.
+    """
+    items = _parse_ali_item_list(blob)
+    if items:
+        return items[:limit]
+
+    titles = _RE_TITLE_B.findall(blob)
+    n = min(len(titles), limit)
+    rows = zip(
+        _convert_matches(titles, n, _decode, None),
+        _convert_matches(_RE_MIN_PRICE_B.findall(blob), n, float, None),
+        _convert_matches(_RE_TRADE_COUNT_B.findall(blob), n, int, None),
+        _convert_matches(_RE_STAR_RATING_B.findall(blob), n, float, None),
+        _convert_matches(_RE_IMG_URL_B.findall(blob), n, _decode, None),
+        _convert_matches(_RE_STORE_NAME_B.findall(blob), n, _decode, None),
+    )
+    return [
+        {"title": title, "price": price, "orders": orders, "rating": rating, "image_url": image_url, "store_name": store_name}
+        for title, price, orders, rating, image_url, store_name in rows
+    ]
+
+
+# Precompiled XPath selectors - evaluated in C against a single lxml tree per page
+_XP_ALI_CARDS = etree.XPath(
+    f"//*[{_xp_class('list--gallery--C2f2tvm')}]//*[{_xp_class('multi--container--1UZxxHY')}]"
+    f" | //*[{_xp_class('search-card-item')}]"
+)
+_XP_ALI_TITLE = etree.XPath(f".//*[{_xp_class('multi--titleText--nXeOvyr')}] | .//h3")
+_XP_ALI_PRICE = etree.XPath(f".//*[{_xp_class('multi--price-sale--U-S0jtj')}] | .//*[{_xp_class('search-card-e-price-main')}]")
+_XP_ALI_ORDERS = etree.XPath(f".//*[{_xp_class('multi--trade--Ktbl2jB')}] | .//*[{_xp_class('search-card-e-review')}]")
+_XP_IMG_SRC = etree.XPath(".//img/@src")
+_XP_AMZ_ITEMS = etree.XPath(f"//*[@id='zg-ordered-list']//li | //*[{_xp_class('zg-item-immersion')}]")
+_XP_AMZ_GRID_ITEMS = etree.XPath("//div[@data-asin] | //div[contains(@id, 'gridItem')]")
+_XP_AMZ_PRODUCT_LINKS = etree.XPath("//a[contains(@href, '/dp/')]")
+_XP_PARENT_DIV = etree.XPath("ancestor::div[1]")
+_XP_AMZ_OFFSCREEN_PRICE = etree.XPath(
+    f".//*[{_xp_class('a-price')}]//*[{_xp_class('a-offscreen')}] | .//span[{_xp_class('a-price')}]//span"
+)
+_XP_AMZ_NAME = etree.XPath(
+    f".//*[{_xp_class('zg-text-center-align')}] | .//*[{_xp_class('_cDEzb_p13n-sc-css-line-clamp-1_1Fn1y')}]"
+    f" | .//*[{_xp_class('p13n-sc-truncate')}] | .//a[contains(@href, '/dp/')]"
+    " | .//span[contains(@class, 'truncate')] | .//div[contains(@class, 'truncate')]"
+    f" | .//*[{_xp_class('a-link-normal')}]//span"
+)
+_XP_AMZ_PRICE = etree.XPath(
+    f".//*[{_xp_class('p13n-sc-price')}] | .//*[{_xp_class('_cDEzb_p13n-sc-price_3mJ9Z')}]"
+    f" | .//*[{_xp_class('a-price')}]//*[{_xp_class('a-offscreen')}] | .//span[{_xp_class('a-price')}]//span"
+)
+_XP_AMZ_PERCENT = etree.XPath(f".//*[{_xp_class('zg-percent-change')}] | .//*[{_xp_class('a-size-small')}]")
+_XP_OG_DESCRIPTION = etree.XPath("//meta[@property='og:description']/@content")
+_XP_TIKTOK_SCRIPTS = etree.XPath(
+    "//script[@type='application/ld+json'"
+    " or contains(text(), '__UNIVERSAL_DATA_FOR_REHYDRATION__') or contains(text(), 'SIGI_STATE')]"
+)
+_XP_META_CARDS = etree.XPath(
+    f"//*[{_xp_class('_7jvw')}] | //*[{_xp_class('x1dr75xp')}] | //*[@data-testid='ad_library_card']"
+)
+_XP_META_ADVERTISER = etree.XPath(
+    f".//*[{_xp_class('_7jyr')}] | .//*[{_xp_class('x8t9es0')}] | .//a[contains(@href, 'page_id')]"
+)
+_XP_META_BODY = etree.XPath(
+    f".//*[{_xp_class('_7jws')}] | .//*[{_xp_class('x1iorvi4')}] | .//div[@data-testid='ad_creative_body']"
+)
 
 
 class TikTokScanner:
@@ -43,7 +346,7 @@ class TikTokScanner:
     # TikTok Creative Center has internal API endpoints
     HASHTAG_API = "https://ads.tiktok.com/creative_radar_api/v1/popular_trend/hashtag/list"
 
-    async def scan_trending(self, niche: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def scan_trending(self, niche: Optional[str] = None, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
         """Scan TikTok Creative Center for trending hashtags related to products"""
         products = []
         product_hashtags = [
@@ -51,99 +354,109 @@ class TikTokScanner:
             "musthave", "gadgettok", "homeessentials", "cleaningtok",
         ]
 
-        async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-            # Try Creative Center API for trending hashtags
-            try:
-                resp = await client.get(
-                    self.HASHTAG_API,
-                    params={
-                        "page": 1,
-                        "limit": 50,
-                        "period": 7,
-                        "country_code": "US",
-                        "sort_by": "popular",
-                    },
-                    headers={
-                        **_get_headers(0),
-                        "Referer": self.CREATIVE_CENTER_URL,
-                    },
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    # Broader keyword matching for product-related hashtags
-                    product_kw = [
-                        "buy", "find", "product", "gadget", "must", "hack", "deal",
-                        "clean", "home", "kitchen", "beauty", "fitness", "tech", "gift",
-                        "amazon", "shop", "unbox", "review", "haul", "worth", "best",
-                        "tool", "organiz", "storage", "lamp", "light", "phone", "car",
-                    ]
-                    for item in data.get("data", {}).get("list", []):
-                        name = item.get("hashtag_name", "")
-                        if any(kw in name.lower() for kw in product_kw):
-                            products.append({
-                                "source": "tiktok",
-                                "name": name.replace("#", "").replace("_", " ").title(),
-                                "trend_data": {
-                                    "hashtag": f"#{name}",
-                                    "views": item.get("publish_cnt", 0),
-                                    "growth_rate": item.get("trend", 0),
-                                    "video_count": item.get("video_cnt", 0),
-                                },
-                                "discovered_at": datetime.now(timezone.utc).isoformat(),
-                            })
-            except Exception as e:
-                logger.warning(f"TikTok Creative Center API failed: {e}")
-
-            # Fallback: scrape TikTok tag pages
-            if not products:
-                for tag in product_hashtags[:4]:
-                    try:
-                        resp = await client.get(
-                            f"https://www.tiktok.com/tag/{tag}",
-                            headers=_get_headers(1),
-                        )
-                        if resp.status_code == 200:
-                            soup = BeautifulSoup(resp.text, "html.parser")
-                            meta = soup.find("meta", {"property": "og:description"})
-                            view_text = meta.get("content", "") if meta else ""
-                            views = _parse_view_count(view_text)
-
-                            # Try JSON-LD scripts
-                            for script in soup.find_all("script", {"type": "application/ld+json"})[:5]:
-                                try:
-                                    ld = json.loads(script.string or "{}")
-                                    desc = ld.get("description", "") or ld.get("name", "")
-                                    if desc and len(desc) > 10:
-                                        products.append({
-                                            "source": "tiktok",
-                                            "name": _extract_product_name(desc, tag),
-                                            "trend_data": {"hashtag": f"#{tag}", "views": views, "growth_rate": 0},
-                                            "discovered_at": datetime.now(timezone.utc).isoformat(),
-                                        })
-                                except (json.JSONDecodeError, AttributeError):
-                                    pass
-
-                            # Also try __UNIVERSAL_DATA_FOR_REHYDRATION__ for video descriptions
-                            for script in soup.find_all("script"):
-                                text = script.string or ""
-                                if "__UNIVERSAL_DATA_FOR_REHYDRATION__" in text or "SIGI_STATE" in text:
-                                    desc_matches = re.findall(r'"desc"\s*:\s*"([^"]{10,80})"', text)
-                                    for desc in desc_matches[:5]:
-                                        products.append({
-                                            "source": "tiktok",
-                                            "name": _extract_product_name(desc, tag),
-                                            "trend_data": {"hashtag": f"#{tag}", "views": views, "growth_rate": 0},
-                                            "discovered_at": datetime.now(timezone.utc).isoformat(),
-                                        })
-                                    if desc_matches:
-                                        break
-                        await asyncio.sleep(1)
-                    except Exception as e:
-                        logger.warning(f"TikTok tag scrape failed for #{tag}: {e}")
+        client = client or _get_client()
+        # Try Creative Center API for trending hashtags
+        try:
+            resp = await client.get(
+                self.HASHTAG_API,
+                params={
+                    "page": 1,
+                    "limit": 50,
+                    "period": 7,
+                    "country_code": "US",
+                    "sort_by": "popular",
+                },
+                headers={
+                    **_get_headers(0),
+                    "Referer": self.CREATIVE_CENTER_URL,
+                },
+            )
+            if resp.status_code == 200:
+                data = orjson.loads(resp.content)
+                now_iso = datetime.now(timezone.utc).isoformat()
+                for item in data.get("data", {}).get("list", []):
+                    name = item.get("hashtag_name", "")
+                    if _RE_TIKTOK_PRODUCT_KW.search(name):
+                        products.append({
+                            "source": "tiktok",
+                            "name": name.replace("#", "").replace("_", " ").title(),
+                            "trend_data": {
+                                "hashtag": f"#{name}",
+                                "views": item.get("publish_cnt", 0),
+                                "growth_rate": item.get("trend", 0),
+                                "video_count": item.get("video_cnt", 0),
+                            },
+                            "discovered_at": now_iso,
+                        })
+        except Exception as e:
+            logger.warning(f"TikTok Creative Center API failed: {e}")
+
+        # Fallback: scrape TikTok tag pages concurrently
+        if not products:
+            tags = product_hashtags[:4]
+            results = await asyncio.gather(
+                *(self._scrape_tag(client, tag) for tag in tags),
+                return_exceptions=True,
+            )
+            for tag, tag_products in zip(tags, results):
+                if isinstance(tag_products, EmptyScrape):
+                    continue  # page had no product mentions - not a failure
+                if isinstance(tag_products, Exception):
+                    logger.warning(f"TikTok tag scrape failed for #{tag}: {tag_products}")
+                    continue
+                products.extend(_copy_products(tag_products))
 
         logger.info(f"TikTok scanner found {len(products)} products")
         return products[:10]
 
+    @staticmethod
+    @alru_cache(maxsize=64, ttl=_SCRAPE_CACHE_TTL)
+    async def _scrape_tag(client: httpx.AsyncClient, tag: str) -> Tuple[Dict[str, Any], ...]:
+        """Scrape one TikTok tag page for product mentions (cached, raises on HTTP errors or no results)"""
+        products = []
+        url = f"https://www.tiktok.com/tag/{tag}"
+        async with _host_slot(url):
+            resp = await client.get(url, headers=_get_headers(1))
+        resp.raise_for_status()
+        # Challenge/consent pages carry none of the script blobs - don't build a DOM for them
+        if resp.status_code == 200 and any(marker in resp.content for marker in _TIKTOK_SCRIPT_MARKERS):
+            tree = lxml.html.fromstring(resp.content)
+            now_iso = datetime.now(timezone.utc).isoformat()
+            og_description = _XP_OG_DESCRIPTION(tree)
+            views = _parse_view_count(og_description[0] if og_description else "")
+
+            # One pass over the candidate scripts: JSON-LD blocks (first 5) and the
+            # __UNIVERSAL_DATA_FOR_REHYDRATION__ / SIGI_STATE blob with video descriptions
+            ld_descs, state_descs = [], []
+            ld_seen = 0
+            for script in _XP_TIKTOK_SCRIPTS(tree):
+                if script.get("type") == "application/ld+json":
+                    if ld_seen == 5:
+                        continue
+                    ld_seen += 1
+                    try:
+                        ld = orjson.loads(script.text or "{}")
+                        desc = ld.get("description", "") or ld.get("name", "")
+                        if desc and len(desc) > 10:
+                            ld_descs.append(desc)
+                    except (orjson.JSONDecodeError, AttributeError):
+                        pass
+                elif not state_descs:
+                    state_descs = _RE_TIKTOK_DESC.findall(script.text or "")[:5]
+
+            products = [
+                {
+                    "source": "tiktok",
+                    "name": _extract_product_name(desc, tag),
+                    "trend_data": {"hashtag": f"#{tag}", "views": views, "growth_rate": 0},
+                    "discovered_at": now_iso,
+                }
+                for desc in ld_descs + state_descs
+            ]
+        if not products:
+            raise EmptyScrape(f"no product mentions on {url}")
+        return tuple(products)
+
 
 class AmazonScanner:
     """Scrapes Amazon Movers & Shakers for trending products"""
@@ -157,7 +470,7 @@ class AmazonScanner:
         "Pet Supplies": "https://www.amazon.com/gp/movers-and-shakers/pet-supplies",
     }
 
-    async def scan_movers_shakers(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def scan_movers_shakers(self, category: Optional[str] = None, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
         """Scrape Amazon Movers & Shakers for products with biggest rank increases"""
         products = []
         urls = {}
@@ -168,100 +481,39 @@ class AmazonScanner:
             for cat in ["Electronics", "Home & Kitchen", "Beauty"]:
                 urls[cat] = self.MOVERS_URLS[cat]
 
-        async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-            for cat_name, url in urls.items():
-                try:
-                    resp = await client.get(url, headers=_get_headers(2))
-                    if resp.status_code == 200:
-                        soup = BeautifulSoup(resp.text, "html.parser")
-
-                        # Try multiple selector strategies - Amazon frequently changes class names
-                        items = soup.select("#zg-ordered-list li, .zg-item-immersion")
-
-                        # Fallback: look for any div/li with product links
-                        if not items:
-                            items = soup.select("div[data-asin], div[id*='gridItem']")
-
-                        # Fallback: broader approach - find all links to /dp/ product pages
-                        if not items:
-                            links = soup.select("a[href*='/dp/']")
-                            seen_names = set()
-                            for link in links[:15]:
-                                name = link.get_text(strip=True)
-                                if name and len(name) > 5 and len(name) < 200 and name not in seen_names:
-                                    seen_names.add(name)
-                                    # Find nearby image
-                                    parent = link.find_parent("div")
-                                    img_el = parent.select_one("img[src]") if parent else None
-                                    image_url = img_el.get("src", "") if img_el else ""
-                                    # Find nearby price
-                                    price = 0
-                                    price_el = parent.select_one(".a-price .a-offscreen, span.a-price span") if parent else None
-                                    if price_el:
-                                        price = _parse_price(price_el.get_text(strip=True))
-
-                                    products.append({
-                                        "source": "amazon",
-                                        "name": name[:80],
-                                        "image_url": image_url,
-                                        "trend_data": {
-                                            "rank_change": 0,
-                                            "category": cat_name,
-                                            "current_price": price,
-                                        },
-                                        "discovered_at": datetime.now(timezone.utc).isoformat(),
-                                    })
-                            if products:
-                                logger.info(f"Amazon: fallback link parsing found {len(products)} for {cat_name}")
-
-                        for item in items[:5]:
-                            name_el = item.select_one(
-                                ".zg-text-center-align, ._cDEzb_p13n-sc-css-line-clamp-1_1Fn1y, "
-                                ".p13n-sc-truncate, a[href*='/dp/'], "
-                                "span[class*='truncate'], div[class*='truncate'], "
-                                ".a-link-normal span"
-                            )
-                            price_el = item.select_one(
-                                ".p13n-sc-price, ._cDEzb_p13n-sc-price_3mJ9Z, "
-                                ".a-price .a-offscreen, span.a-price span"
-                            )
-                            img_el = item.select_one("img[src]")
-
-                            name = name_el.get_text(strip=True) if name_el else None
-                            if not name or len(name) < 3:
-                                continue
-
-                            price_text = price_el.get_text(strip=True) if price_el else "$0"
-                            price = _parse_price(price_text)
-                            image_url = img_el.get("src", "") if img_el else ""
-
-                            rank_change = 0
-                            percent_el = item.select_one(".zg-percent-change, .a-size-small")
-                            if percent_el:
-                                try:
-                                    rank_change = int(re.sub(r'[^\d]', '', percent_el.get_text(strip=True)) or 0)
-                                except ValueError:
-                                    pass
-
-                            products.append({
-                                "source": "amazon",
-                                "name": name[:80],
-                                "image_url": image_url,
-                                "trend_data": {
-                                    "rank_change": rank_change,
-                                    "category": cat_name,
-                                    "current_price": price,
-                                },
-                                "discovered_at": datetime.now(timezone.utc).isoformat(),
-                            })
-
-                    await asyncio.sleep(1)
-                except Exception as e:
-                    logger.warning(f"Amazon scrape failed for {cat_name}: {e}")
+        client = client or _get_client()
+        # Categories are independent pages - fetch them concurrently
+        results = await asyncio.gather(
+            *(self._scrape_category(client, cat_name, url) for cat_name, url in urls.items()),
+            return_exceptions=True,
+        )
+        for cat_name, cat_products in zip(urls, results):
+            if isinstance(cat_products, EmptyScrape):
+                continue  # page had no listings - not a failure
+            if isinstance(cat_products, Exception):
+                logger.warning(f"Amazon scrape failed for {cat_name}: {cat_products}")
+                continue
+            products.extend(_copy_products(cat_products))
 
         logger.info(f"Amazon scanner found {len(products)} products")
         return products[:15]
 
+    @staticmethod
+    @alru_cache(maxsize=32, ttl=_SCRAPE_CACHE_TTL)
+    async def _scrape_category(client: httpx.AsyncClient, cat_name: str, url: str) -> Tuple[Dict[str, Any], ...]:
+        """Scrape one Movers & Shakers category page (cached, raises on HTTP errors or no results)"""
+        products = []
+        async with _host_slot(url):
+            resp = await client.get(url, headers=_get_headers(2))
+        resp.raise_for_status()
+        if resp.status_code == 200:
+            # Parsing a several-hundred-KB page is CPU work - keep it off the event loop
+            # (lxml releases the GIL while parsing, so categories parse in parallel)
+            products = await asyncio.to_thread(_parse_movers_page, resp.content, cat_name)
+        if not products:
+            raise EmptyScrape(f"no products on {url}")
+        return tuple(products)
+
 
 class AliExpressScanner:
     """Scrapes AliExpress for trending/hot products with supplier data"""
@@ -269,7 +521,7 @@ class AliExpressScanner:
     SEARCH_URL = "https://www.aliexpress.com/w/wholesale-{query}.html"
     HOT_URL = "https://www.aliexpress.com/popular/{category}.html"
 
-    async def scan_trending(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def scan_trending(self, category: Optional[str] = None, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
         """Scrape AliExpress for hot products with supplier pricing"""
         products = []
         search_terms = [
@@ -279,126 +531,135 @@ class AliExpressScanner:
         if category:
             search_terms = [f"{category} bestseller", f"{category} trending"]
 
-        async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-            for term in search_terms[:2]:
-                try:
-                    url = f"https://www.aliexpress.com/w/wholesale-{quote_plus(term)}.html"
-                    params = {"SortType": "total_tranpro_desc"}  # Sort by orders
-                    resp = await client.get(url, params=params, headers=_get_headers(3))
-
-                    if resp.status_code == 200:
-                        soup = BeautifulSoup(resp.text, "html.parser")
-
-                        # AliExpress renders product data in script tags
-                        for script in soup.find_all("script"):
-                            text = script.string or ""
-                            if "window._dida_config_" in text or "runParams" in text:
-                                # Extract product JSON data
-                                json_matches = re.findall(r'"title":"([^"]{5,80})"', text)
-                                price_matches = re.findall(r'"minPrice":"?(\d+\.?\d*)"?', text)
-                                order_matches = re.findall(r'"tradeCount":"?(\d+)"?', text)
-                                rating_matches = re.findall(r'"starRating":"?(\d+\.?\d*)"?', text)
-                                image_matches = re.findall(r'"imgUrl":"(https?://[^"]+)"', text)
-
-                                for i in range(min(len(json_matches), 8)):
-                                    name = json_matches[i]
-                                    price = float(price_matches[i]) if i < len(price_matches) else 0
-                                    orders = int(order_matches[i]) if i < len(order_matches) else 0
-                                    rating = float(rating_matches[i]) if i < len(rating_matches) else 0
-                                    image_url = image_matches[i] if i < len(image_matches) else ""
-
-                                    if price > 0 and name:
-                                        products.append({
-                                            "source": "aliexpress",
-                                            "name": name,
-                                            "image_url": image_url,
-                                            "trend_data": {
-                                                "orders_30d": orders,
-                                                "price": price,
-                                                "rating": rating,
-                                                "order_velocity": round(orders / 30, 1) if orders else 0,
-                                            },
-                                            "discovered_at": datetime.now(timezone.utc).isoformat(),
-                                        })
-
-                        # Alternative: parse product cards directly
-                        if not products:
-                            cards = soup.select(".list--gallery--C2f2tvm .multi--container--1UZxxHY, .search-card-item")
-                            for card in cards[:8]:
-                                title_el = card.select_one(".multi--titleText--nXeOvyr, h3")
-                                price_el = card.select_one(".multi--price-sale--U-S0jtj, .search-card-e-price-main")
-                                orders_el = card.select_one(".multi--trade--Ktbl2jB, .search-card-e-review")
-                                img_el = card.select_one("img[src]")
-
-                                title = title_el.get_text(strip=True) if title_el else None
-                                if not title:
-                                    continue
-
-                                price = _parse_price(price_el.get_text(strip=True)) if price_el else 0
-                                orders_text = orders_el.get_text(strip=True) if orders_el else "0"
-                                orders = _parse_order_count(orders_text)
-                                image_url = img_el.get("src", "") if img_el else ""
-
-                                products.append({
-                                    "source": "aliexpress",
-                                    "name": title[:80],
-                                    "image_url": image_url,
-                                    "trend_data": {
-                                        "orders_30d": orders,
-                                        "price": price,
-                                        "rating": 0,
-                                        "order_velocity": round(orders / 30, 1) if orders else 0,
-                                    },
-                                    "discovered_at": datetime.now(timezone.utc).isoformat(),
-                                })
-
-                    await asyncio.sleep(1)
-                except Exception as e:
-                    logger.warning(f"AliExpress scrape failed for '{term}': {e}")
+        client = client or _get_client()
+        # Search terms are independent - fetch them concurrently
+        results = await asyncio.gather(
+            *(self._scan_search_term(client, term) for term in search_terms[:2])
+        )
+        for term_products in results:
+            products.extend(term_products)
 
         logger.info(f"AliExpress scanner found {len(products)} products")
         return products[:15]
 
-    async def find_suppliers(self, product_name: str) -> List[Dict[str, Any]]:
-        """Find suppliers for a specific product on AliExpress"""
-        suppliers = []
+    async def _scan_search_term(self, client: httpx.AsyncClient, term: str) -> List[Dict[str, Any]]:
+        """Fetch one AliExpress search page and extract its products"""
+        products = []
+        try:
+            url = f"https://www.aliexpress.com/w/wholesale-{quote_plus(term)}.html"
+            params = {"SortType": "total_tranpro_desc"}  # Sort by orders
+            async with _host_slot(url):
+                resp = await client.get(url, params=params, headers=_get_headers(3))
 
-        async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-            try:
-                url = f"https://www.aliexpress.com/w/wholesale-{quote_plus(product_name)}.html"
-                params = {"SortType": "total_tranpro_desc"}
-                resp = await client.get(url, params=params, headers=_get_headers(4))
-
-                if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-
-                    # Parse product listings as potential suppliers
-                    for script in soup.find_all("script"):
-                        text = script.string or ""
-                        if "window._dida_config_" in text or "runParams" in text:
-                            titles = re.findall(r'"title":"([^"]{5,80})"', text)
-                            prices = re.findall(r'"minPrice":"?(\d+\.?\d*)"?', text)
-                            orders = re.findall(r'"tradeCount":"?(\d+)"?', text)
-                            ratings = re.findall(r'"starRating":"?(\d+\.?\d*)"?', text)
-                            store_names = re.findall(r'"storeName":"([^"]+)"', text)
-
-                            for i in range(min(len(titles), 5)):
-                                price = float(prices[i]) if i < len(prices) else 0
-                                if price <= 0:
-                                    continue
-                                suppliers.append({
-                                    "name": store_names[i] if i < len(store_names) else f"Supplier {i+1}",
-                                    "platform": "aliexpress",
-                                    "unit_cost": price,
-                                    "shipping_cost": round(price * 0.15, 2),  # Estimate ~15% for ePacket
-                                    "shipping_days": "10-20",
-                                    "rating": float(ratings[i]) if i < len(ratings) else 4.5,
-                                    "total_orders": int(orders[i]) if i < len(orders) else 0,
-                                })
-            except Exception as e:
-                logger.warning(f"AliExpress supplier search failed for '{product_name}': {e}")
+            if resp.status_code == 200:
+                body = resp.content
+                now_iso = datetime.now(timezone.utc).isoformat()
+
+                # AliExpress renders product data in script tags
+                for text in _iter_script_blobs(body, _ALI_SCRIPT_MARKERS):
+                    for item in _extract_ali_items(text, 8):
+                        name = item["title"]
+                        price = item["price"] or 0
+                        orders = item["orders"] or 0
+                        rating = item["rating"] or 0
+                        image_url = item["image_url"] or ""
+
+                        if price > 0 and name:
+                            products.append({
+                                "source": "aliexpress",
+                                "name": name,
+                                "image_url": image_url,
+                                "trend_data": {
+                                    "orders_30d": orders,
+                                    "price": price,
+                                    "rating": rating,
+                                    "order_velocity": round(orders / 30, 1) if orders else 0,
+                                },
+                                "discovered_at": now_iso,
+                            })
+                    # Listings live in a single runParams blob per page
+                    if products:
+                        break
+
+                # Alternative: parse product cards directly (only if the markup is there)
+                if not products and any(marker in body for marker in _ALI_CARD_MARKERS):
+                    tree = lxml.html.fromstring(body)
+                    for card in _XP_ALI_CARDS(tree)[:8]:
+                        title = _xp_text(_XP_ALI_TITLE(card))
+                        if not title:
+                            continue
+
+                        price_text = _xp_text(_XP_ALI_PRICE(card))
+                        price = _parse_price(price_text) if price_text else 0
+                        orders = _parse_order_count(_xp_text(_XP_ALI_ORDERS(card)) or "0")
+                        img_srcs = _XP_IMG_SRC(card)
+                        image_url = img_srcs[0] if img_srcs else ""
+
+                        products.append({
+                            "source": "aliexpress",
+                            "name": title[:80],
+                            "image_url": image_url,
+                            "trend_data": {
+                                "orders_30d": orders,
+                                "price": price,
+                                "rating": 0,
+                                "order_velocity": round(orders / 30, 1) if orders else 0,
+                            },
+                            "discovered_at": now_iso,
+                        })
+        except Exception as e:
+            logger.warning(f"AliExpress scrape failed for '{term}': {e}")
+        return products
 
-        return suppliers
+    async def find_suppliers(self, product_name: str, client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
+        """Find suppliers for a specific product on AliExpress"""
+        client = client or _get_client()
+        try:
+            # Normalize so trivially different spellings share a cache entry
+            query = " ".join(product_name.lower().split())
+            suppliers = await self._search_suppliers(client, query)
+            return [dict(s) for s in suppliers]
+        except EmptyScrape:
+            # No supplier listings - an empty result, raised only so it isn't cached
+            return []
+        except Exception as e:
+            logger.warning(f"AliExpress supplier search failed for '{product_name}': {e}")
+            return []
+
+    @staticmethod
+    @alru_cache(maxsize=128, ttl=_SCRAPE_CACHE_TTL)
+    async def _search_suppliers(client: httpx.AsyncClient, query: str) -> Tuple[Dict[str, Any], ...]:
+        """Search AliExpress listings for `query` as potential suppliers (cached, raises on HTTP errors or no results)"""
+        suppliers = []
+        url = f"https://www.aliexpress.com/w/wholesale-{quote_plus(query)}.html"
+        params = {"SortType": "total_tranpro_desc"}
+        # Supplier lookups fan out over products - share the per-host cap with the other scrapers
+        async with _host_slot(url):
+            resp = await client.get(url, params=params, headers=_get_headers(4))
+        resp.raise_for_status()
+
+        if resp.status_code == 200:
+            # Parse product listings as potential suppliers
+            for text in _iter_script_blobs(resp.content, _ALI_SCRIPT_MARKERS):
+                for i, item in enumerate(_extract_ali_items(text, 5)):
+                    price = item["price"] or 0
+                    if price <= 0:
+                        continue
+                    suppliers.append({
+                        "name": item["store_name"] or f"Supplier {i+1}",
+                        "platform": "aliexpress",
+                        "unit_cost": price,
+                        "shipping_cost": round(price * 0.15, 2),  # Estimate ~15% for ePacket
+                        "shipping_days": "10-20",
+                        "rating": item["rating"] if item["rating"] is not None else 4.5,
+                        "total_orders": item["orders"] or 0,
+                    })
+                if suppliers:
+                    break
+
+        if not suppliers:
+            raise EmptyScrape(f"no supplier listings on {url}")
+        return tuple(suppliers)
 
 
 class GoogleTrendsScanner:
@@ -411,7 +672,9 @@ class GoogleTrendsScanner:
         try:
             from pytrends.request import TrendReq
 
-            pytrends = TrendReq(hl='en-US', tz=300)
+            # pytrends is synchronous (including the cookie fetch in TrendReq()),
+            # so every call runs in a worker thread to keep the event loop free
+            pytrends = await asyncio.to_thread(TrendReq, hl='en-US', tz=300)
 
             # Product-related seed keywords to find rising terms
             seed_keywords = [
@@ -420,19 +683,25 @@ class GoogleTrendsScanner:
             if category:
                 seed_keywords = [category]
 
+            # Lowercased queries already added - rising lists for different seeds often overlap
+            seen_queries = set()
+            now_iso = datetime.now(timezone.utc).isoformat()
+
             for keyword in seed_keywords[:2]:
                 try:
-                    pytrends.build_payload([keyword], cat=0, timeframe='now 7-d', geo='US')
-                    related = pytrends.related_queries()
+                    await asyncio.to_thread(pytrends.build_payload, [keyword], cat=0, timeframe='now 7-d', geo='US')
+                    related = await asyncio.to_thread(pytrends.related_queries)
 
                     if keyword in related and related[keyword].get("rising") is not None:
                         rising_df = related[keyword]["rising"]
-                        for _, row in rising_df.head(5).iterrows():
-                            query = row.get("query", "")
-                            value = row.get("value", 0)
+                        for row in rising_df.head(5).itertuples(index=False):
+                            query = getattr(row, "query", "")
+                            value = getattr(row, "value", 0)
 
                             # Filter for product-like terms (exclude people, places)
-                            if query and len(query) > 3:
+                            query_key = query.lower() if query else ""
+                            if len(query_key) > 3 and query_key not in seen_queries:
+                                seen_queries.add(query_key)
                                 products.append({
                                     "source": "google_trends",
                                     "name": query.title(),
@@ -442,7 +711,7 @@ class GoogleTrendsScanner:
                                         "monthly_volume": 0,  # pytrends doesn't give exact volume
                                         "trend_direction": "up",
                                     },
-                                    "discovered_at": datetime.now(timezone.utc).isoformat(),
+                                    "discovered_at": now_iso,
                                 })
 
                     await asyncio.sleep(1)  # Rate limit pytrends
@@ -460,9 +729,8 @@ class MetaAdLibraryScanner:
     """Scrapes the public Meta Ad Library for competitor ad data"""
 
     SEARCH_URL = "https://www.facebook.com/ads/library/"
-    API_URL = "https://www.facebook.com/ads/library/async/search_ads/"
 
-    async def scan_product_ads(self, product_name: str) -> Dict[str, Any]:
+    async def scan_product_ads(self, product_name: str, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
         """Scrape Meta Ad Library for ads related to a product"""
         result = {
             "product": product_name,
@@ -474,101 +742,86 @@ class MetaAdLibraryScanner:
             "scanned_at": datetime.now(timezone.utc).isoformat(),
         }
 
-        async with httpx.AsyncClient(timeout=20, follow_redirects=True) as client:
-            try:
-                # Search the public ad library page
-                params = {
-                    "active_status": "active",
-                    "ad_type": "all",
-                    "country": "US",
-                    "q": product_name,
-                    "media_type": "all",
-                }
-                resp = await client.get(
-                    self.SEARCH_URL,
-                    params=params,
-                    headers=_get_headers(0),
-                )
-
-                if resp.status_code == 200:
-                    soup = BeautifulSoup(resp.text, "html.parser")
-
-                    # Count ad results
-                    ad_cards = soup.select("._7jvw, .x1dr75xp, [data-testid='ad_library_card']")
-                    result["total_ads"] = len(ad_cards)
-                    result["active_ads"] = len(ad_cards)
-
-                    # Extract advertiser names
-                    advertisers = {}
-                    for card in ad_cards[:20]:
-                        name_el = card.select_one("._7jyr, .x8t9es0, a[href*='page_id']")
-                        if name_el:
-                            name = name_el.get_text(strip=True)
-                            advertisers[name] = advertisers.get(name, 0) + 1
-
-                    result["top_advertisers"] = [
-                        {"name": name, "ad_count": count}
-                        for name, count in sorted(advertisers.items(), key=lambda x: x[1], reverse=True)[:5]
-                    ]
-
-                    # Extract common hooks from ad text
-                    hooks = set()
-                    for card in ad_cards[:10]:
-                        text_el = card.select_one("._7jws, .x1iorvi4, div[data-testid='ad_creative_body']")
-                        if text_el:
-                            text = text_el.get_text(strip=True)
-                            # First line is usually the hook
-                            first_line = text.split(".")[0].strip()
-                            if first_line and len(first_line) > 5:
-                                hooks.add(first_line[:80])
-
-                    result["common_hooks"] = list(hooks)[:5]
-
-                    # If we got no results from HTML, try the async endpoint
-                    if result["total_ads"] == 0:
-                        result = await self._search_via_api(client, product_name, result)
-
-            except Exception as e:
-                logger.warning(f"Meta Ad Library scrape failed for '{product_name}': {e}")
-
-        return result
-
-    async def _search_via_api(self, client: httpx.AsyncClient, product_name: str, result: Dict) -> Dict:
-        """Try the Meta Ad Library API endpoint as fallback"""
+        client = client or _get_client()
         try:
+            # Search the public ad library page
+            params = {
+                "active_status": "active",
+                "ad_type": "all",
+                "country": "US",
+                "q": product_name,
+                "media_type": "all",
+            }
             resp = await client.get(
-                "https://www.facebook.com/ads/library/",
-                params={
-                    "active_status": "active",
-                    "ad_type": "all",
-                    "country": "ALL",
-                    "q": product_name,
-                },
-                headers={**_get_headers(1), "Accept": "text/html"},
+                self.SEARCH_URL,
+                params=params,
+                headers=_get_headers(0),
             )
+
             if resp.status_code == 200:
-                # Count approximate results from page text
-                text = resp.text
-                count_match = re.search(r'(\d[\d,]*)\s*(?:results|ads)', text, re.I)
-                if count_match:
-                    count = int(count_match.group(1).replace(",", ""))
-                    result["total_ads"] = count
-                    result["active_ads"] = count
+                tree = lxml.html.fromstring(resp.content)
+
+                # Count ad results
+                ad_cards = _XP_META_CARDS(tree)
+                result["total_ads"] = len(ad_cards)
+                result["active_ads"] = len(ad_cards)
+
+                # Extract advertiser names
+                advertisers = Counter(
+                    _xp_text(name_nodes)
+                    for name_nodes in map(_XP_META_ADVERTISER, ad_cards[:20])
+                    if name_nodes
+                )
+
+                result["top_advertisers"] = [
+                    {"name": name, "ad_count": count}
+                    for name, count in advertisers.most_common(5)
+                ]
+
+                # Extract common hooks from ad text
+                hooks = set()
+                for card in ad_cards[:10]:
+                    body_nodes = _XP_META_BODY(card)
+                    if body_nodes:
+                        text = _xp_text(body_nodes)
+                        # First line is usually the hook
+                        first_line = text.split(".")[0].strip()
+                        if first_line and len(first_line) > 5:
+                            hooks.add(first_line[:80])
+
+                result["common_hooks"] = list(hooks)[:5]
+
+                # No rendered ad cards - count approximate results from the same page's text
+                # rather than re-requesting the library
+                if result["total_ads"] == 0:
+                    count_match = _RE_AD_COUNT.search(resp.text)
+                    if count_match:
+                        count = int(count_match.group(1).replace(",", ""))
+                        result["total_ads"] = count
+                        result["active_ads"] = count
+
         except Exception as e:
-            logger.warning(f"Meta Ad Library API fallback failed: {e}")
+            logger.warning(f"Meta Ad Library scrape failed for '{product_name}': {e}")
+
         return result
 
 
 class CompetitorScanner:
     """Scrapes competitor Shopify stores via their public products.json"""
 
-    async def scan_store(self, store_url: str) -> Dict[str, Any]:
+    async def scan_store(self, store_url: str, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
         """Scrape a Shopify store's product catalog via products.json"""
         # Normalize URL
         store_url = store_url.rstrip("/")
         if not store_url.startswith("http"):
             store_url = f"https://{store_url}"
 
+        # Competitor checks poll the same stores repeatedly - reuse a recent successful scan
+        cached = _store_scan_cache.get(store_url)
+        if cached and time.monotonic() - cached[0] < _STORE_SCAN_TTL:
+            result = cached[1]
+            return {**result, "products": [dict(p) for p in result["products"]]}
+
         result = {
             "store_url": store_url,
             "store_name": store_url.split("//")[-1].split(".")[0].title(),
@@ -578,74 +831,55 @@ class CompetitorScanner:
             "scanned_at": datetime.now(timezone.utc).isoformat(),
         }
 
-        async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-            try:
-                # Shopify stores expose products.json publicly
-                products_url = f"{store_url}/products.json"
-                resp = await client.get(products_url, headers=_get_headers(0))
-
-                if resp.status_code == 200:
-                    data = resp.json()
-                    raw_products = data.get("products", [])
-
-                    for p in raw_products:
-                        # Get the lowest variant price
-                        variants = p.get("variants", [{}])
-                        prices = [float(v.get("price", "0")) for v in variants if v.get("price")]
-                        price = min(prices) if prices else 0
-
-                        result["products"].append({
-                            "name": p.get("title", "Unknown"),
-                            "price": price,
-                            "category": p.get("product_type", "Uncategorized"),
-                            "url": f"{store_url}/products/{p.get('handle', '')}",
-                            "image_url": (p.get("images", [{}])[0].get("src", "") if p.get("images") else ""),
-                            "created_at": p.get("created_at", ""),
-                            "updated_at": p.get("updated_at", ""),
-                        })
+        client = client or _get_client()
+        try:
+            # Shopify stores expose products.json publicly
+            products_url = f"{store_url}/products.json"
+            status, raw_products = await stream_shopify_products(
+                client, products_url, _get_headers(0), _SHOPIFY_MAX_PRODUCTS
+            )
 
-                    result["total_products"] = len(result["products"])
-                    result["store_name"] = _extract_store_name(resp.text, store_url)
-
-                    # Paginate if more products (Shopify returns 30 per page)
-                    page = 2
-                    while len(raw_products) == 30 and page <= 5:
-                        resp2 = await client.get(f"{products_url}?page={page}", headers=_get_headers(1))
-                        if resp2.status_code == 200:
-                            more = resp2.json().get("products", [])
-                            if not more:
-                                break
-                            raw_products = more
-                            for p in more:
-                                variants = p.get("variants", [{}])
-                                prices = [float(v.get("price", "0")) for v in variants if v.get("price")]
-                                price = min(prices) if prices else 0
-                                result["products"].append({
-                                    "name": p.get("title", "Unknown"),
-                                    "price": price,
-                                    "category": p.get("product_type", "Uncategorized"),
-                                    "url": f"{store_url}/products/{p.get('handle', '')}",
-                                    "image_url": (p.get("images", [{}])[0].get("src", "") if p.get("images") else ""),
-                                    "created_at": p.get("created_at", ""),
-                                    "updated_at": p.get("updated_at", ""),
-                                })
-                            result["total_products"] = len(result["products"])
-                            page += 1
-                        else:
+            if status == 200:
+                result["products"].extend(_shopify_product(store_url, p) for p in raw_products)
+                result["total_products"] = len(result["products"])
+
+                # Paginate if more products (Shopify returns 30 per page).
+                # Pages are independent, so fetch 2-5 together and stop at the first short page.
+                if len(raw_products) == 30:
+                    page_results = await asyncio.gather(
+                        *(
+                            stream_shopify_products(
+                                client, f"{products_url}?page={page}", _get_headers(1), _SHOPIFY_PAGE_SIZE
+                            )
+                            for page in range(2, 6)
+                        ),
+                        return_exceptions=True,
+                    )
+                    for page_result in page_results:
+                        if isinstance(page_result, Exception) or page_result[0] != 200:
+                            break
+                        more = page_result[1]
+                        if not more:
+                            break
+                        remaining = _SHOPIFY_MAX_PRODUCTS - len(result["products"])
+                        result["products"].extend(_shopify_product(store_url, p) for p in more[:remaining])
+                        result["total_products"] = len(result["products"])
+                        if len(more) < 30 or len(result["products"]) >= _SHOPIFY_MAX_PRODUCTS:
                             break
-                        await asyncio.sleep(0.5)
 
-                else:
-                    logger.warning(f"Could not access {products_url} - status {resp.status_code}. Store may not be Shopify.")
+                _cache_store_scan(store_url, result)
 
-            except Exception as e:
-                logger.warning(f"Competitor store scrape failed for {store_url}: {e}")
+            else:
+                logger.warning(f"Could not access {products_url} - status {status}. Store may not be Shopify.")
+
+        except Exception as e:
+            logger.warning(f"Competitor store scrape failed for {store_url}: {e}")
 
         return result
 
-    async def detect_new_products(self, store_url: str, previous_products: List[str]) -> List[Dict[str, Any]]:
+    async def detect_new_products(self, store_url: str, previous_products: List[str], client: Optional[httpx.AsyncClient] = None) -> List[Dict[str, Any]]:
         """Detect new products added to a store since last scan"""
-        current_scan = await self.scan_store(store_url)
+        current_scan = await self.scan_store(store_url, client=client)
         previous_names = set(previous_products)
 
         new_products = [
@@ -698,69 +932,226 @@ class ProductScoutEngine:
 
     async def analyze_product(self, product_name: str) -> Dict[str, Any]:
         """Analyze a specific product across sources"""
-        ad_data = await self.meta_ads.scan_product_ads(product_name)
-        suppliers = await self.aliexpress.find_suppliers(product_name)
+        # Facebook and AliExpress lookups are independent - run them together
+        ad_data, suppliers = await asyncio.gather(
+            self.meta_ads.scan_product_ads(product_name),
+            self.aliexpress.find_suppliers(product_name),
+            return_exceptions=True,
+        )
+        if isinstance(ad_data, Exception):
+            logger.warning(f"Meta Ad scan failed for '{product_name}': {ad_data}")
+            ad_data = {}
+        if isinstance(suppliers, Exception):
+            logger.warning(f"Supplier search failed for '{product_name}': {suppliers}")
+            suppliers = []
 
         return {
             "product_name": product_name,
             "competition_analysis": ad_data,
             "suppliers": suppliers,
-            "recommendation": "low_competition" if ad_data["total_ads"] < 50 else "high_competition",
+            "recommendation": "low_competition" if ad_data.get("total_ads", 0) < 50 else "high_competition",
             "analyzed_at": datetime.now(timezone.utc).isoformat(),
         }
 
 
 # ========== Helper Functions ==========
 
+_RE_PRICE = re.compile(r'[\d,]+\.?\d*')
+_RE_ORDER_COUNT = re.compile(r'(\d+(?:\.\d+)?)\s*(k?)')
+_RE_VIEW_COUNT = re.compile(r'(\d+(?:\.\d+)?)\s*([BMK]?)')
+_VIEW_MULTIPLIERS = {"B": 1_000_000_000, "M": 1_000_000, "K": 1_000, "": 1}
+# Hashtags and anything that isn't a word char, space, hyphen or apostrophe - one pass
+_RE_NAME_NOISE = re.compile(r'#\w+|[^\w\s\-\']')
+
+
 def _parse_price(text: str) -> float:
     """Extract price from text like '$29.99' or 'US $5.80'"""
-    match = re.search(r'[\d,]+\.?\d*', text.replace(",", ""))
+    match = _RE_PRICE.search(text.replace(",", ""))
     return float(match.group()) if match else 0.0
 
 
 def _parse_order_count(text: str) -> int:
     """Parse order count from text like '1.2K+ sold' or '15,000 orders'"""
-    text = text.lower().replace(",", "").replace("+", "")
-    match = re.search(r'([\d.]+)\s*k', text)
-    if match:
-        return int(float(match.group(1)) * 1000)
-    match = re.search(r'(\d+)', text)
-    return int(match.group(1)) if match else 0
+    # Single pass over the text; a "k" figure wins over a plain one, as in the old k-then-digits lookup
+    matches = _RE_ORDER_COUNT.findall(text.lower().replace(",", "").replace("+", ""))
+    for number, k in matches:
+        if k:
+            return int(float(number) * 1000)
+    return int(float(matches[0][0])) if matches else 0
 
 
 def _parse_view_count(text: str) -> int:
     """Parse view count from text like '47.2M views' or '1.5B views'"""
-    text = text.upper().replace(",", "")
-    match = re.search(r'([\d.]+)\s*B', text)
-    if match:
-        return int(float(match.group(1)) * 1_000_000_000)
-    match = re.search(r'([\d.]+)\s*M', text)
-    if match:
-        return int(float(match.group(1)) * 1_000_000)
-    match = re.search(r'([\d.]+)\s*K', text)
-    if match:
-        return int(float(match.group(1)) * 1_000)
-    match = re.search(r'(\d+)', text)
-    return int(match.group(1)) if match else 0
+    # Single pass over the text; the largest unit wins, matching the old B > M > K > plain lookup order
+    best_number, best_suffix = None, ""
+    for number, suffix in _RE_VIEW_COUNT.findall(text.upper().replace(",", "")):
+        if best_number is None or _VIEW_MULTIPLIERS[suffix] > _VIEW_MULTIPLIERS[best_suffix]:
+            best_number, best_suffix = number, suffix
+    if best_number is None:
+        return 0
+    return int(float(best_number) * _VIEW_MULTIPLIERS[best_suffix])
+
+
+def _parse_movers_page(content: bytes, cat_name: str) -> List[Dict[str, Any]]:
+    """Extract products from a Movers & Shakers page (runs in a worker thread)"""
+    products = []
+    tree = lxml.html.fromstring(content)
+    now_iso = datetime.now(timezone.utc).isoformat()
+
+    # Try multiple selector strategies - Amazon frequently changes class names
+    items = _XP_AMZ_ITEMS(tree)
+
+    # Fallback: look for any div/li with product links
+    if not items:
+        items = _XP_AMZ_GRID_ITEMS(tree)
+
+    # Fallback: broader approach - find all links to /dp/ product pages
+    if not items:
+        links = _XP_AMZ_PRODUCT_LINKS(tree)
+        # Normalized fingerprints, so names differing only in case/punctuation count once
+        seen_keys = set()
+        for link in links[:15]:
+            name = _xp_text([link])
+            if not name or len(name) <= 5 or len(name) >= 200:
+                continue
+            key = _RE_NAME_FINGERPRINT.sub('', name.lower())[:40]
+            if key not in seen_keys:
+                seen_keys.add(key)
+                parents = _XP_PARENT_DIV(link)
+                # Find nearby image
+                img_srcs = _XP_IMG_SRC(parents[0]) if parents else []
+                image_url = img_srcs[0] if img_srcs else ""
+                # Find nearby price
+                price = 0
+                price_text = _xp_text(_XP_AMZ_OFFSCREEN_PRICE(parents[0])) if parents else ""
+                if price_text:
+                    price = _parse_price(price_text)
+
+                products.append({
+                    "source": "amazon",
+                    "name": name[:80],
+                    "image_url": image_url,
+                    "trend_data": {
+                        "rank_change": 0,
+                        "category": cat_name,
+                        "current_price": price,
+                    },
+                    "discovered_at": now_iso,
+                })
+        if products:
+            logger.info(f"Amazon: fallback link parsing found {len(products)} for {cat_name}")
+
+    for item in items[:5]:
+        name = _xp_text(_XP_AMZ_NAME(item))
+        if not name or len(name) < 3:
+            continue
+
+        price = _parse_price(_xp_text(_XP_AMZ_PRICE(item)) or "$0")
+        img_srcs = _XP_IMG_SRC(item)
+        image_url = img_srcs[0] if img_srcs else ""
+
+        rank_change = 0
+        percent_nodes = _XP_AMZ_PERCENT(item)
+        if percent_nodes:
+            try:
+                rank_change = int("".join(filter(str.isdecimal, _xp_text(percent_nodes))) or 0)
+            except ValueError:
+                pass
+
+        products.append({
+            "source": "amazon",
+            "name": name[:80],
+            "image_url": image_url,
+            "trend_data": {
+                "rank_change": rank_change,
+                "category": cat_name,
+                "current_price": price,
+            },
+            "discovered_at": now_iso,
+        })
+    return products
+
+
+_SHOPIFY_PAGE_SIZE = 30
+_SHOPIFY_MAX_PRODUCTS = 5 * _SHOPIFY_PAGE_SIZE
+_STORE_SCAN_TTL = 300
+_store_scan_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _cache_store_scan(store_url: str, result: Dict[str, Any]):
+    """Remember a successful store scan, dropping expired entries as we go"""
+    now = time.monotonic()
+    for url in [url for url, (ts, _) in _store_scan_cache.items() if now - ts >= _STORE_SCAN_TTL]:
+        del _store_scan_cache[url]
+    _store_scan_cache[store_url] = (now, {**result, "products": [dict(p) for p in result["products"]]})
+
+
+class _AsyncByteReader:
+    """Async file-like view over an httpx byte stream, as consumed by ijson"""
+
+    def __init__(self, resp: httpx.Response):
+        self._chunks = resp.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str - don't consume a chunk for it
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def stream_shopify_products(
+    client: httpx.AsyncClient, url: str, headers: Mapping[str, str], limit: int
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Stream a Shopify products.json page, parsing items incrementally and stopping after `limit`.
+
+    Shared by the store scanner and competitor_spy. Requests to one store host are capped
+    by the per-host semaphore, and 429/503 responses are retried after the host's
+    Retry-After (or an exponential backoff) up to _MAX_RETRIES times.
+
+    Returns (status_code, products) - products is empty for non-200 responses.
+    """
+    products = []
+    host = urlsplit(url).hostname or ""
+    for attempt in range(_MAX_RETRIES + 1):
+        await _wait_for_host(host)
+        # Pages 2-5 are fetched together - cap them per store host rather than serializing
+        async with _host_slot(url), client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code in _RETRY_STATUSES and attempt < _MAX_RETRIES:
+                delay = _retry_after_seconds(resp.headers.get("retry-after"))
+                _defer_host(host, 0.5 * 2 ** attempt if delay is None else delay)
+                continue
+            if resp.status_code != 200:
+                return resp.status_code, products
+            async for item in ijson.items(_AsyncByteReader(resp), "products.item", use_float=True):
+                products.append(item)
+                if len(products) >= limit:
+                    break
+        return 200, products
+
+
+def _shopify_product(store_url: str, p: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a competitor product entry from one Shopify products.json item"""
+    # Lowest variant price, without materializing a list of all variant prices
+    price = min((float(v["price"]) for v in p.get("variants", []) if v.get("price")), default=0)
+    return {
+        "name": p.get("title", "Unknown"),
+        "price": price,
+        "category": p.get("product_type", "Uncategorized"),
+        "url": f"{store_url}/products/{p.get('handle', '')}",
+        "image_url": (p.get("images", [{}])[0].get("src", "") if p.get("images") else ""),
+        "created_at": p.get("created_at", ""),
+        "updated_at": p.get("updated_at", ""),
+    }
 
 
 def _extract_product_name(description: str, hashtag: str) -> str:
     """Best-effort extraction of a product name from a TikTok video description"""
     # Remove hashtags and emojis, take first meaningful phrase
-    cleaned = re.sub(r'#\w+', '', description)
-    cleaned = re.sub(r'[^\w\s\-\']', '', cleaned).strip()
+    cleaned = _RE_NAME_NOISE.sub('', description).strip()
     words = cleaned.split()
     if len(words) > 2:
         return " ".join(words[:5]).title()
     return hashtag.replace("_", " ").title()
-
-
-def _extract_store_name(html: str, url: str) -> str:
-    """Extract store name from page HTML or fall back to URL"""
-    soup = BeautifulSoup(html, "html.parser")
-    title = soup.find("title")
-    if title:
-        name = title.get_text(strip=True).split("|")[0].split("-")[0].strip()
-        if name and len(name) > 1:
-            return name
-    return url.split("//")[-1].split(".")[0].title()
@@ -2,13 +2,20 @@
 Background Job Scheduler - Runs scans and sends daily Telegram reports
 """
 import asyncio
+import heapq
+import uuid
+import zlib
+from collections import defaultdict
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, List
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import pytz
 import logging
 
+from services.ai_scanner import create_scanner
+from services.telegram_bot import TelegramBot
+
 logger = logging.getLogger(__name__)
 
 # Tier scan frequencies (hours between scans)
@@ -20,14 +27,90 @@ TIER_SCAN_FREQUENCY = {
     "enterprise": 2  # 12 times per day
 }
 
+# Scheduled user scans allowed to run at the same time
+MAX_CONCURRENT_SCANS = 10
+# Daily reports in flight at once - stays under Telegram's ~30 messages/second
+MAX_CONCURRENT_REPORTS = 30
+# Daily reports are spread over this many seconds after 7 AM instead of all firing at once
+REPORT_SPREAD_SECONDS = 600
+
 EASTERN_TZ = pytz.timezone('US/Eastern')
 
+# Only the user fields the daily report reads
+REPORT_USER_FIELDS = {
+    "_id": 0, "id": 1, "email": 1, "telegram_bot_token": 1, "telegram_chat_id": 1,
+    "notification_preferences.daily_report": 1,
+}
+
+# Only the product fields the daily report reads
+REPORT_PRODUCT_FIELDS = {
+    "_id": 0, "name": 1, "overall_score": 1, "trend_score": 1, "source_cost": 1,
+    "recommended_price": 1, "margin_percent": 1, "active_fb_ads": 1, "trend_direction": 1,
+}
+
+
+def _due_for_scan_filter(now: datetime) -> Dict[str, Any]:
+    """Mongo filter for users with an OpenAI key whose tier scan interval has elapsed.
+
+    last_scan_at is a BSON date, so each tier's cutoff is a plain range match Mongo can
+    evaluate without per-user date math. Users on unknown/missing tiers get the default 24h interval.
+    Leftover legacy string values are treated as due - the next scan rewrites them as dates.
+    """
+    def cutoff(hours: int) -> datetime:
+        return now - timedelta(hours=hours)
+
+    due = [{"last_scan_at": None}, {"last_scan_at": {"$type": "string"}}]
+    due.extend(
+        {"subscription_tier": tier, "last_scan_at": {"$lte": cutoff(hours)}}
+        for tier, hours in TIER_SCAN_FREQUENCY.items()
+    )
+    due.append({"subscription_tier": {"$nin": list(TIER_SCAN_FREQUENCY)}, "last_scan_at": {"$lte": cutoff(24)}})
+    return {"openai_api_key": {"$ne": None}, "$or": due}
+
+
+def _report_delay(user_id: str) -> float:
+    """Stable per-user offset into the daily report window (crc32, not the per-process salted hash)"""
+    return zlib.crc32(user_id.encode()) % (REPORT_SPREAD_SECONDS * 10) / 10
+
+
+def _report_data(products: List[Dict], total_daily_products: int, report_date: str) -> Dict[str, Any]:
+    """Daily report payload for TelegramBot.format_daily_report, built from real product data"""
+    return {
+        "report_date": report_date,
+        "products_scanned": total_daily_products,
+        "passed_filters": len(products),
+        "fully_validated": len(products),
+        "ready_to_launch": len(products),
+        "top_products": [
+            {
+                "name": p.get("name", "Unknown"),
+                "score": p.get("overall_score", p.get("trend_score", 0)),
+                "source_cost": p.get("source_cost", 0),
+                "sell_price": p.get("recommended_price", 0),
+                "margin": p.get("margin_percent", 0),
+                "fb_ads": p.get("active_fb_ads", 0),
+                "trend_direction": p.get("trend_direction", "up"),
+                "trend_percent": p.get("trend_score", 0),
+            }
+            for p in products
+        ],
+        "alerts": [],
+    }
+
+
+def _product_score(product: Dict[str, Any]):
+    return product.get("overall_score", product.get("trend_score", 0))
+
 
 class ScanScheduler:
     def __init__(self, db):
         self.db = db
         self.scheduler = AsyncIOScheduler(timezone=EASTERN_TZ)
         self._running = False
+        self._scan_sem = asyncio.Semaphore(MAX_CONCURRENT_SCANS)
+        self._bots: Dict[str, TelegramBot] = {}
+        # One send at a time per bot token - reports fan out across bots, not within one
+        self._bot_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     def start(self):
         """Start the scheduler"""
@@ -72,35 +155,24 @@ class ScanScheduler:
         """Check and run scans for users based on their tier frequency"""
         logger.info("Running scheduled scan check...")
 
-        users = await self.db.users.find(
-            {"openai_api_key": {"$ne": None}},
-            {"_id": 0, "id": 1, "email": 1, "subscription_tier": 1, "openai_api_key": 1, "last_scan_at": 1}
-        ).to_list(1000)
-
-        now = datetime.now(timezone.utc)
-
-        for user in users:
-            tier = user.get("subscription_tier", "free")
-            frequency_hours = TIER_SCAN_FREQUENCY.get(tier, 24)
-            last_scan = user.get("last_scan_at")
-
-            # Check if scan is due
-            should_scan = False
-            if not last_scan:
-                should_scan = True
-            else:
-                if isinstance(last_scan, str):
-                    last_scan = datetime.fromisoformat(last_scan.replace('Z', '+00:00'))
-                hours_since_scan = (now - last_scan).total_seconds() / 3600
-                should_scan = hours_since_scan >= frequency_hours
-
-            if should_scan:
-                await self.run_user_scan(user)
+        # Only users whose tier interval has elapsed are loaded - the due check runs in Mongo.
+        # Scans are mostly waiting on scrapers and OpenAI - each starts as its user arrives,
+        # bounded by the scan semaphore inside run_user_scan
+        user_ids, tasks = [], []
+        async for user in self.db.users.find(
+            _due_for_scan_filter(datetime.now(timezone.utc)),
+            {"_id": 0, "id": 1, "email": 1, "subscription_tier": 1, "openai_api_key": 1, "last_scan_at": 1, "filters": 1}
+        ):
+            user_ids.append(user.get("id"))
+            tasks.append(asyncio.create_task(self.run_user_scan(user)))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for user_id, result in zip(user_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Scan failed for user {user_id}: {result}")
 
     async def run_user_scan(self, user: Dict[str, Any]):
         """Run AI scan for a specific user"""
-        from services.ai_scanner import create_scanner
-
         user_id = user["id"]
         openai_key = user.get("openai_api_key")
 
@@ -108,59 +180,58 @@ class ScanScheduler:
             logger.warning(f"Skipping scan for user {user_id} - no OpenAI API key")
             return
 
-        logger.info(f"Running scan for user {user_id} ({user.get('email')})")
-
-        try:
-            scanner = create_scanner(openai_key)
-            user_doc = await self.db.users.find_one({"id": user_id}, {"_id": 0, "filters": 1})
-            filters = user_doc.get("filters", {}) if user_doc else {}
-            results = await scanner.run_full_scan(filters)
-
-            # Store scan results
-            scan_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-            scan_record = {
-                "user_id": user_id,
-                "scan_date": scan_date,
-                "scan_type": "scheduled",
-                "results_summary": {
-                    "total_products": results.get("count", 0),
-                    "source_stats": results.get("source_stats", {}),
-                    "raw_products_scraped": results.get("raw_products_scraped", 0),
-                },
-                "created_at": datetime.now(timezone.utc).isoformat()
-            }
-            await self.db.scan_history.insert_one(scan_record)
-
-            # Update user's last scan time
-            await self.db.users.update_one(
-                {"id": user_id},
-                {"$set": {"last_scan_at": datetime.now(timezone.utc).isoformat()}}
-            )
+        async with self._scan_sem:
+            logger.info(f"Running scan for user {user_id} ({user.get('email')})")
 
-            # Process and store discovered products
-            await self._process_scan_results(user_id, scan_date, results)
-
-            logger.info(f"Scan complete for user {user_id} - {results.get('count', 0)} products found")
+            try:
+                scanner = create_scanner(openai_key)
+                # filters come with the due-users query - no second lookup per scan
+                results = await scanner.run_full_scan(user.get("filters") or {})
+
+                # Store scan results - one timestamp for the record, last_scan_at and products
+                finished_at = datetime.now(timezone.utc)
+                finished_iso = finished_at.isoformat()
+                scan_date = finished_at.strftime("%Y-%m-%d")
+                scan_record = {
+                    "user_id": user_id,
+                    "scan_date": scan_date,
+                    "scan_type": "scheduled",
+                    "results_summary": {
+                        "total_products": results.get("count", 0),
+                        "source_stats": results.get("source_stats", {}),
+                        "raw_products_scraped": results.get("raw_products_scraped", 0),
+                    },
+                    "created_at": finished_iso
+                }
+                # The history record, last scan time and discovered products are
+                # independent writes - issue them together
+                await asyncio.gather(
+                    self.db.scan_history.insert_one(scan_record),
+                    self.db.users.update_one(
+                        {"id": user_id},
+                        {"$set": {"last_scan_at": finished_at}}
+                    ),
+                    self._process_scan_results(user_id, scan_date, results, finished_iso),
+                )
+
+                logger.info(f"Scan complete for user {user_id} - {results.get('count', 0)} products found")
 
-        except Exception as e:
-            logger.error(f"Scan failed for user {user_id}: {e}")
+            except Exception as e:
+                logger.error(f"Scan failed for user {user_id}: {e}")
 
-    async def _process_scan_results(self, user_id: str, scan_date: str, results: Dict):
+    async def _process_scan_results(self, user_id: str, scan_date: str, results: Dict, discovered_at: str):
         """Process scan results and store as daily products for this user"""
-        import uuid
-
         products = results.get("products", [])
         if not products:
             return
 
-        # Sort by overall_score or trend_score and take top 10
-        products.sort(key=lambda x: x.get("overall_score", x.get("trend_score", 0)), reverse=True)
-        top_products = products[:10]
+        # Top 10 by overall_score or trend_score - a bounded heap instead of sorting everything
+        top_products = heapq.nlargest(10, products, key=_product_score)
 
-        # Store as daily products for this specific user
-        for product in top_products:
-            product_doc = {
-                "id": str(uuid.uuid4()),
+        # Store as daily products for this specific user - one batched write
+        product_docs = [
+            {
+                "id": uuid.uuid4().hex,
                 "user_id": user_id,
                 "scan_date": scan_date,
                 "name": product.get("name", "Unknown"),
@@ -178,17 +249,20 @@ class ScanScheduler:
                 "trend_direction": product.get("trend_direction", "stable"),
                 "estimated_views": product.get("estimated_views", 0),
                 "is_active": True,
-                "discovered_at": datetime.now(timezone.utc).isoformat(),
+                "discovered_at": discovered_at,
             }
-            await self.db.daily_products.insert_one(product_doc)
+            for product in top_products
+        ]
+        await self.db.daily_products.insert_many(product_docs, ordered=False)
 
     async def archive_daily_products(self):
         """Archive yesterday's products before new scan"""
-        yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+        now = datetime.now(timezone.utc)
+        yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
 
         result = await self.db.daily_products.update_many(
             {"scan_date": yesterday, "is_active": True},
-            {"$set": {"is_active": False, "archived_at": datetime.now(timezone.utc).isoformat()}}
+            {"$set": {"is_active": False, "archived_at": now.isoformat()}}
         )
         logger.info(f"Archived {result.modified_count} products from {yesterday}")
 
@@ -196,100 +270,112 @@ class ScanScheduler:
         """Send daily Telegram reports to all configured users"""
         logger.info("Sending daily Telegram reports...")
 
-        # Get users with Telegram configured
-        users = await self.db.users.find(
-            {
-                "telegram_bot_token": {"$ne": None},
-                "telegram_chat_id": {"$ne": None}
-            },
-            {"_id": 0}
-        ).to_list(1000)
-
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        sent_count = 0
+        now = datetime.now(timezone.utc)
+        today = now.strftime("%Y-%m-%d")
+        report_date = now.strftime("%B %d, %Y")
+        # The seed-product fallback is the same for every user - fetch it once per run
+        seed_products = await self.db.products.find(
+            {}, REPORT_PRODUCT_FIELDS
+        ).sort("overall_score", -1).limit(5).to_list(5)
+        seed_messages: Dict[int, str] = {}
+        report_sem = asyncio.Semaphore(MAX_CONCURRENT_REPORTS)
 
-        for user in users:
+        async def send_one(user: Dict) -> bool:
+            # One bad user document must not fail the whole run
             try:
                 # Check notification preferences
-                prefs = user.get("notification_preferences", {})
+                prefs = user.get("notification_preferences") or {}
                 if prefs.get("daily_report") is False:
                     logger.info(f"Skipping daily report for {user.get('email')} - disabled in preferences")
-                    continue
-                success = await self._send_user_report(user, today)
-                if success:
-                    sent_count += 1
+                    return False
+                await asyncio.sleep(_report_delay(user["id"]))
+                async with report_sem:
+                    return await self._send_user_report(user, today, report_date, seed_products, seed_messages)
             except Exception as e:
                 logger.error(f"Failed to send report to {user.get('email')}: {e}")
+                return False
 
-        logger.info(f"Daily reports sent to {sent_count}/{len(users)} users")
-
-    async def _send_user_report(self, user: Dict, scan_date: str) -> bool:
+        # Get users with Telegram configured - each report starts as its user arrives
+        tasks = []
+        bot_tokens = set()
+        async for user in self.db.users.find(
+            {
+                "telegram_bot_token": {"$ne": None},
+                "telegram_chat_id": {"$ne": None}
+            },
+            REPORT_USER_FIELDS
+        ):
+            bot_tokens.add(user.get("telegram_bot_token"))
+            tasks.append(asyncio.create_task(send_one(user)))
+
+        results = await asyncio.gather(*tasks)
+        self._prune_bots(bot_tokens)
+        sent_count = sum(1 for success in results if success)
+
+        logger.info(f"Daily reports sent to {sent_count}/{len(tasks)} users")
+
+    def _prune_bots(self, bot_tokens: set):
+        """Forget bots and locks for tokens no longer configured (revoked or rotated)"""
+        for token in self._bots.keys() - bot_tokens:
+            del self._bots[token]
+        for token in self._bot_locks.keys() - bot_tokens:
+            del self._bot_locks[token]
+
+    def _get_bot(self, bot_token: str) -> TelegramBot:
+        """Bot for a user's token, reused across reports (bots share one pooled HTTP client)"""
+        bot = self._bots.get(bot_token)
+        if bot is None:
+            bot = self._bots[bot_token] = TelegramBot(bot_token)
+        return bot
+
+    async def _send_user_report(
+        self, user: Dict, scan_date: str, report_date: str,
+        seed_products: List[Dict], seed_messages: Dict[int, str]
+    ) -> bool:
         """Send daily report to a single user with real stats"""
-        from services.telegram_bot import TelegramBot
-
         user_id = user["id"]
 
-        # Get today's products for THIS user first, then fall back to global
-        products = await self.db.daily_products.find(
-            {"user_id": user_id, "scan_date": scan_date, "is_active": True},
-            {"_id": 0}
-        ).sort("overall_score", -1).limit(5).to_list(5)
+        # Get today's products for THIS user first (then fall back to global below),
+        # counting today's products in the same round trip
+        products, total_daily_products = await asyncio.gather(
+            self.db.daily_products.find(
+                {"user_id": user_id, "scan_date": scan_date, "is_active": True},
+                REPORT_PRODUCT_FIELDS
+            ).sort("overall_score", -1).limit(5).to_list(5),
+            self.db.daily_products.count_documents(
+                {"user_id": user_id, "scan_date": scan_date}
+            ),
+        )
 
         if not products:
             # Fallback to any active products for this user
             products = await self.db.daily_products.find(
                 {"user_id": user_id, "is_active": True},
-                {"_id": 0}
+                REPORT_PRODUCT_FIELDS
             ).sort("overall_score", -1).limit(5).to_list(5)
 
         if not products:
             # Final fallback to seed products
-            products = await self.db.products.find(
-                {}, {"_id": 0}
-            ).sort("overall_score", -1).limit(5).to_list(5)
+            products = seed_products
 
         if not products:
             logger.info(f"No products to report for user {user_id}")
             return False
 
-        # Get REAL scan stats from scan_history
-        total_scanned = await self.db.scan_history.count_documents({"user_id": user_id})
-        today_scans = await self.db.scan_history.count_documents(
-            {"user_id": user_id, "scan_date": scan_date}
-        )
-        total_daily_products = await self.db.daily_products.count_documents(
-            {"user_id": user_id, "scan_date": scan_date}
-        )
-
-        # Build report with real data
-        report_data = {
-            "products_scanned": total_daily_products,
-            "passed_filters": len(products),
-            "fully_validated": len(products),
-            "ready_to_launch": len(products),
-            "top_products": [
-                {
-                    "name": p.get("name", "Unknown"),
-                    "score": p.get("overall_score", p.get("trend_score", 0)),
-                    "source_cost": p.get("source_cost", 0),
-                    "sell_price": p.get("recommended_price", 0),
-                    "margin": p.get("margin_percent", 0),
-                    "fb_ads": p.get("active_fb_ads", 0),
-                    "trend_direction": p.get("trend_direction", "up"),
-                    "trend_percent": p.get("trend_score", 0),
-                }
-                for p in products
-            ],
-            "alerts": [],
-        }
+        # Seed-product reports differ only by today's count - render each variant once per run
+        if products is seed_products:
+            message = seed_messages.get(total_daily_products)
+            if message is None:
+                message = seed_messages[total_daily_products] = TelegramBot.format_daily_report(
+                    _report_data(products, total_daily_products, report_date)
+                )
+        else:
+            message = TelegramBot.format_daily_report(_report_data(products, total_daily_products, report_date))
 
         # Send via user's own bot
-        bot = TelegramBot()
-        bot.bot_token = user["telegram_bot_token"]
-        bot.is_configured = True
-        bot.base_url = f"https://api.telegram.org/bot{user['telegram_bot_token']}"
-
-        result = await bot.send_daily_report(user["telegram_chat_id"], report_data)
+        bot_token = user["telegram_bot_token"]
+        async with self._bot_locks[bot_token]:
+            result = await self._get_bot(bot_token).send_message(user["telegram_chat_id"], message)
 
         if result.get("success"):
             logger.info(f"Report sent to {user.get('email')}")
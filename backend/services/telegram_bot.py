@@ -9,6 +9,48 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Pooled client shared by every bot instance - all calls go to api.telegram.org"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(http2=True, timeout=15)
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the shared Telegram HTTP client (called on app shutdown)"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+# Daily report pieces, formatted per report instead of grown with += per product
+_DAILY_REPORT_HEADER = """
+🌅 <b>GOOD MORNING! YOUR DAILY PRODUCT INTELLIGENCE</b>
+📅 {date}
+
+📊 <b>OVERNIGHT SCAN RESULTS:</b>
+├── Products Scanned: <b>{scanned:,}</b>
+├── Passed Filters: <b>{passed}</b>
+├── Fully Validated: <b>{validated}</b>
+└── Ready to Launch: <b>{ready}</b> ⭐
+
+🔥 <b>TOP OPPORTUNITIES:</b>
+"""
+
+_DAILY_REPORT_PRODUCT = """
+<b>#{i} {name}</b> (Score: {score}/100)
+├── Source: ${source_cost:.2f} | Sell: ${sell_price:.2f}
+├── Margin: {margin}% | FB Ads: {fb_ads}
+└── Trend: {trend_emoji} {trend_percent:+}%
+"""
+
+_TREND_EMOJI = {"up": "📈", "down": "📉"}
+
 
 class TelegramBot:
     """
@@ -16,8 +58,8 @@ class TelegramBot:
     Replicates the ClawdBot Telegram integration from the original X post.
     """
     
-    def __init__(self):
-        self.bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
+    def __init__(self, bot_token: Optional[str] = None):
+        self.bot_token = bot_token or os.getenv("TELEGRAM_BOT_TOKEN")
         self.is_configured = bool(self.bot_token)
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}" if self.bot_token else None
     
@@ -27,81 +69,83 @@ class TelegramBot:
             return {"error": "Telegram bot not configured", "success": False}
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/sendMessage",
-                    json={
-                        "chat_id": chat_id,
-                        "text": text,
-                        "parse_mode": parse_mode
-                    }
-                )
-                result = response.json()
-                
-                # Handle Telegram API errors with helpful messages
-                if response.status_code != 200 or not result.get("ok"):
-                    error_code = result.get("error_code", response.status_code)
-                    error_desc = result.get("description", "Unknown error")
-                    
-                    # Provide helpful error messages
-                    if error_code == 403:
-                        return {
-                            "success": False, 
-                            "error": "Bot blocked or not started",
-                            "detail": "You must START a conversation with your bot first! Open Telegram, search for your bot, and click START or send /start"
-                        }
-                    elif error_code == 400 and "chat not found" in error_desc.lower():
-                        return {
-                            "success": False,
-                            "error": "Invalid Chat ID",
-                            "detail": "The Chat ID is incorrect. Message @userinfobot on Telegram to get YOUR personal ID (not the bot's ID)"
-                        }
-                    else:
-                        return {"success": False, "error": error_desc}
+            response = await _get_client().post(
+                f"{self.base_url}/sendMessage",
+                json={
+                    "chat_id": chat_id,
+                    "text": text,
+                    "parse_mode": parse_mode
+                }
+            )
+            result = response.json()
+            
+            # Handle Telegram API errors with helpful messages
+            if response.status_code != 200 or not result.get("ok"):
+                error_code = result.get("error_code", response.status_code)
+                error_desc = result.get("description", "Unknown error")
                 
-                return {"success": True, "response": result}
+                # Provide helpful error messages
+                if error_code == 403:
+                    return {
+                        "success": False, 
+                        "error": "Bot blocked or not started",
+                        "detail": "You must START a conversation with your bot first! Open Telegram, search for your bot, and click START or send /start"
+                    }
+                elif error_code == 400 and "chat not found" in error_desc.lower():
+                    return {
+                        "success": False,
+                        "error": "Invalid Chat ID",
+                        "detail": "The Chat ID is incorrect. Message @userinfobot on Telegram to get YOUR personal ID (not the bot's ID)"
+                    }
+                else:
+                    return {"success": False, "error": error_desc}
+            
+            return {"success": True, "response": result}
         except Exception as e:
             return {"error": str(e), "success": False}
     
-    async def send_daily_report(self, chat_id: str, report_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Send the daily intelligence report to Telegram"""
-        if not self.is_configured:
-            return {"error": "Telegram bot not configured", "success": False}
-        
-        # Format the daily report message
-        message = f"""
-🌅 <b>GOOD MORNING! YOUR DAILY PRODUCT INTELLIGENCE</b>
-📅 {datetime.now(timezone.utc).strftime('%B %d, %Y')}
-
-📊 <b>OVERNIGHT SCAN RESULTS:</b>
-├── Products Scanned: <b>{report_data.get('products_scanned', 0):,}</b>
-├── Passed Filters: <b>{report_data.get('passed_filters', 0)}</b>
-├── Fully Validated: <b>{report_data.get('fully_validated', 0)}</b>
-└── Ready to Launch: <b>{report_data.get('ready_to_launch', 0)}</b> ⭐
-
-🔥 <b>TOP OPPORTUNITIES:</b>
-"""
+    @staticmethod
+    def format_daily_report(report_data: Dict[str, Any]) -> str:
+        """Render the daily intelligence report message"""
+        report_date = report_data.get('report_date') or datetime.now(timezone.utc).strftime('%B %d, %Y')
+        parts = [_DAILY_REPORT_HEADER.format(
+            date=report_date,
+            scanned=report_data.get('products_scanned', 0),
+            passed=report_data.get('passed_filters', 0),
+            validated=report_data.get('fully_validated', 0),
+            ready=report_data.get('ready_to_launch', 0),
+        )]
         # Add top products
-        top_products = report_data.get('top_products', [])
-        for i, product in enumerate(top_products[:5], 1):
-            trend_emoji = "📈" if product.get('trend_direction') == 'up' else "📉" if product.get('trend_direction') == 'down' else "➡️"
-            message += f"""
-<b>#{i} {product.get('name', 'Unknown')}</b> (Score: {product.get('score', 0)}/100)
-├── Source: ${product.get('source_cost', 0):.2f} | Sell: ${product.get('sell_price', 0):.2f}
-├── Margin: {product.get('margin', 0)}% | FB Ads: {product.get('fb_ads', 0)}
-└── Trend: {trend_emoji} {product.get('trend_percent', 0):+}%
-"""
+        parts.extend(
+            _DAILY_REPORT_PRODUCT.format(
+                i=i,
+                name=product.get('name', 'Unknown'),
+                score=product.get('score', 0),
+                source_cost=product.get('source_cost', 0),
+                sell_price=product.get('sell_price', 0),
+                margin=product.get('margin', 0),
+                fb_ads=product.get('fb_ads', 0),
+                trend_emoji=_TREND_EMOJI.get(product.get('trend_direction'), "➡️"),
+                trend_percent=product.get('trend_percent', 0),
+            )
+            for i, product in enumerate(report_data.get('top_products', [])[:5], 1)
+        )
         
         # Add alerts if any
         alerts = report_data.get('alerts', [])
         if alerts:
-            message += "\n⚠️ <b>ALERTS:</b>\n"
-            for alert in alerts[:3]:
-                message += f"• {alert.get('product', 'Unknown')}: {alert.get('message', '')}\n"
+            parts.append("\n⚠️ <b>ALERTS:</b>\n")
+            parts.extend(f"• {alert.get('product', 'Unknown')}: {alert.get('message', '')}\n" for alert in alerts[:3])
         
-        message += "\n💬 Reply with product number to get launch kit!"
+        parts.append("\n💬 Reply with product number to get launch kit!")
+        return "".join(parts)
+    
+    async def send_daily_report(self, chat_id: str, report_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Send the daily intelligence report to Telegram"""
+        if not self.is_configured:
+            return {"error": "Telegram bot not configured", "success": False}
         
-        return await self.send_message(chat_id, message)
+        return await self.send_message(chat_id, self.format_daily_report(report_data))
     
     async def send_product_alert(self, chat_id: str, product: Dict[str, Any], alert_type: str) -> Dict[str, Any]:
         """Send a product alert (new opportunity, competition change, etc.)"""
@@ -190,12 +234,11 @@ View full launch kit in your dashboard!
             if offset:
                 params["offset"] = offset
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/getUpdates",
-                    params=params
-                )
-                return {"success": response.status_code == 200, "updates": response.json()}
+            response = await _get_client().get(
+                f"{self.base_url}/getUpdates",
+                params=params
+            )
+            return {"success": response.status_code == 200, "updates": response.json()}
         except Exception as e:
             return {"error": str(e), "success": False}
     